@@ -1,5 +1,74 @@
+import sys
+
 from prime_generator import get_next_size
 
+# Fibonacci multiplier (2^64 / golden ratio) used to spread the polynomial
+# hash over power-of-two tables, where a shift replaces the modulo
+_FIB_MULT = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# Maps byte codes to hash digit values (a-z -> 0-25, A-Z -> 26-51): one
+# indexed load per character instead of a compare-and-branch
+_CHAR_VAL = bytes(
+    (i - 97) if 97 <= i <= 122 else (i - 65 + 26) if 65 <= i <= 90 else 0
+    for i in range(256))
+
+def _chain_map_items(keys, values):
+    """
+    Yield (key, value) pairs from the parallel stores of a chain-mode map.
+
+    Args:
+        keys (list): Per-bucket keys (None, a bare key, or a list of keys)
+        values (list): Matching per-bucket values
+    """
+    for idx, k in enumerate(keys):
+        if k is None:
+            continue
+        if isinstance(k, list):
+            vals = values[idx]
+            for i, stored in enumerate(k):
+                yield stored, vals[i]
+        else:
+            yield k, values[idx]
+
+def _poly_hash(key, z, m, _cv=_CHAR_VAL):
+    """
+    Polynomial hash of a key reduced mod m.
+
+    Module-level so it runs on plain positional arguments with no self
+    indirection; the lookup table rides along as a default argument.
+
+    Args:
+        key (str): Key to hash
+        z (int): Polynomial base
+        m (int): Table size
+
+    Returns:
+        int: Slot index
+    """
+    poly = 0
+    for v in reversed(key.encode('ascii').translate(_cv)):
+        poly = (poly * z + v) % m
+    return poly
+
+def _fib_slot(key, z, shift, _cv=_CHAR_VAL):
+    """
+    Polynomial hash spread with a Fibonacci multiply, for a power-of-two
+    table addressed by the top 64 - shift bits.
+
+    Args:
+        key (str): Key to hash
+        z (int): Polynomial base
+        shift (int): 64 minus the table's bit width
+
+    Returns:
+        int: Slot index
+    """
+    poly = 0
+    for v in reversed(key.encode('ascii').translate(_cv)):
+        poly = (poly * z + v) & _MASK64
+    return ((poly * _FIB_MULT) & _MASK64) >> shift
+
 class HashTable:
     """
     A flexible hash table implementation supporting different collision resolution strategies.
@@ -22,18 +91,96 @@ class HashTable:
         """
         self.collision_type = collision_type
         self.total_elements = 0
-        
+
         # Setup parameters based on collision type
-        if collision_type == "Double": 
+        if collision_type == "Double":
             self.z, self.z2, self.c2, self.table_size = params[0], params[1], params[2], params[3]
-        else: 
+        else:
             self.z, self.table_size = params[0], params[1]
-        
-        # Initialize table based on collision type
-        if collision_type == "Chain":
-            self.table = [[] for i in range(self.table_size)] 
+
+        # Whether this table stores key-value tuples never changes over its
+        # lifetime, so pick the specialised lookup once here instead of
+        # isinstance-checking every item on every probe step
+        self._is_map = isinstance(self, HashMap)
+        self.find = self._find_map if self._is_map else self._find_set
+
+        self._alloc_table(self.table_size)
+
+    def _alloc_table(self, new_size):
+        """
+        Allocate empty storage for the given size and refresh the derived
+        hashing parameters. Shared by __init__ and the rehash paths, which
+        previously re-entered __init__ and re-ran the whole parameter setup.
+
+        Chain buckets are created lazily: a slot holds the entry itself
+        until the first collision promotes it to a list, avoiding
+        table_size empty-list allocations up front. Chain maps split keys
+        and values into parallel stores so a probe walk reads only keys.
+
+        Args:
+            new_size (int): New table size
+        """
+        self._set_table_size(new_size)
+        if self.collision_type == "Chain" and self._is_map:
+            self.keys = [None] * new_size
+            self.values = [None] * new_size
+            self.table = None
         else:
-            self.table = [None] * self.table_size
+            self.table = [None] * new_size
+            if self.collision_type != "Chain":
+                # Open-addressing modes keep an 8-bit fingerprint per slot
+                # (from the built-in string hash) so a probe walk can reject
+                # a mismatched slot on one byte compare before touching the
+                # stored key — a scalar take on SwissTable-style tag scans
+                self._fps = bytearray(new_size)
+
+    def _set_table_size(self, n):
+        """
+        Record a new table size and refresh the derived hashing parameters.
+
+        Args:
+            n (int): New table size
+        """
+        self.table_size = n
+        # Power-of-two sizes take the Fibonacci fast path in get_slot and
+        # _hashes: a multiply and shift instead of a modulo per character
+        self._pow2_shift = 64 - (n.bit_length() - 1) if n & (n - 1) == 0 else 0
+        # Element count at which dynamic tables rehash (ceil of 3n/4, the
+        # load-factor threshold), precomputed so the per-insert check is a
+        # single integer compare
+        self._resize_at = -(-3 * n // 4)
+        self._compile_get_slot()
+
+    def _compile_get_slot(self):
+        """
+        Bind a get_slot specialised to the current z and table size.
+
+        z and table_size are constant between resizes, yet the generic
+        get_slot reloads them from self on every call. Generating the loop
+        with both baked in as literals removes every attribute load from
+        the hot path; the closure is rebuilt whenever the table resizes.
+        """
+        # _CHAR_VAL rides along as a default argument so the generated loop
+        # reads it as a local rather than a global
+        if self._pow2_shift:
+            src = (
+                "def get_slot(key, _cv=_CHAR_VAL):\n"
+                f"    poly = 0\n"
+                f"    for v in reversed(key.encode('ascii').translate(_cv)):\n"
+                f"        poly = (poly * {self.z} + v) & {_MASK64}\n"
+                f"    return ((poly * {_FIB_MULT}) & {_MASK64}) >> {self._pow2_shift}\n"
+            )
+        else:
+            src = (
+                "def get_slot(key, _cv=_CHAR_VAL):\n"
+                f"    poly = 0\n"
+                f"    for v in reversed(key.encode('ascii').translate(_cv)):\n"
+                f"        poly = (poly * {self.z} + v) % {self.table_size}\n"
+                f"    return poly\n"
+            )
+        namespace = {'_CHAR_VAL': _CHAR_VAL}
+        exec(src, namespace)
+        self.get_slot = namespace['get_slot']
 
     def insert(self, x):
         """
@@ -42,109 +189,290 @@ class HashTable:
         Args:
             x: Element to insert (can be a key or key-value pair)
         """
-        # Extract key, skip if already exists
-        key = x[0] if isinstance(x, tuple) else x
+        # Extract and intern the key: interned strings are stored once per
+        # process and make the == checks in the probe walks short-circuit
+        # on pointer identity. Skip if the key already exists.
+        if self._is_map:
+            key = sys.intern(x[0])
+            x = (key, x[1])
+        else:
+            key = x = sys.intern(x)
         if self.find(key):
             return
-        
-        # Get initial slot
-        idx = self.get_slot(key)
-        
+
         # Insert based on collision resolution method
         if self.collision_type == "Chain":
-            self.table[idx].append(x)
-        elif self.collision_type == "Linear":                           
-            orig_idx = idx
-            while self.table[idx] is not None:
-                idx = (idx + 1) % self.table_size
-                if idx == orig_idx:
-                    return 
-            self.table[idx] = x
+            self._chain_insert(self.get_slot(key), x)
+        elif self.collision_type == "Linear":
+            idx = self.get_slot(key)
+            table = self.table
+            m = self.table_size
+            if self._pow2_shift:
+                # Triangular-number probing: on a power-of-two table the
+                # sequence start + i*(i+1)/2 visits every slot exactly once
+                # and avoids the primary clustering of +1 stepping
+                start = idx
+                mask = m - 1
+                i = 1
+                while table[idx] is not None:
+                    idx = (start + (i * (i + 1)) // 2) & mask
+                    i += 1
+                    if i > m:
+                        return
+            else:
+                orig_idx = idx
+                while table[idx] is not None:
+                    idx = (idx + 1) % m
+                    if idx == orig_idx:
+                        return
+            table[idx] = x
+            self._fps[idx] = hash(key) & 0xFF
         else:  # Double Hashing
-            # Calculate secondary hash for probe sequence
-            step = 0
-            for i in range(len(key)-1, -1, -1):
-                char = key[i]
-                if char.islower():  value = ord(char) - ord('a')
-                else:   value = ord(char) - ord('A') + 26
-                step = (step * self.z2 + value)
-            step = self.c2 - (step%self.c2)
-            
+            # Both hashes come from one pass over the key
+            idx, step = self._hashes(key)
+            table = self.table
+            m = self.table_size
+
             # Find available slot
             orig_idx = idx
-            while self.table[idx] is not None:
-                idx = (idx + step) % self.table_size
+            while table[idx] is not None:
+                idx = (idx + step) % m
                 if idx == orig_idx: return
-            self.table[idx] = x
-        
+            table[idx] = x
+            self._fps[idx] = hash(key) & 0xFF
+
         self.total_elements += 1
-        
+
+    def _chain_insert(self, idx, x):
+        """
+        Place an entry into chain bucket idx; the duplicate check is the
+        caller's responsibility.
+
+        Args:
+            idx (int): Bucket index
+            x: Entry to place (key or key-value pair)
+        """
+        if self._is_map:
+            k = self.keys[idx]
+            if k is None:
+                self.keys[idx] = x[0]
+                self.values[idx] = x[1]
+            elif isinstance(k, list):
+                k.append(x[0])
+                self.values[idx].append(x[1])
+            else:
+                self.keys[idx] = [k, x[0]]
+                self.values[idx] = [self.values[idx], x[1]]
+        else:
+            slot = self.table[idx]
+            if slot is None:
+                self.table[idx] = x
+            elif isinstance(slot, list):
+                slot.append(x)
+            else:
+                self.table[idx] = [slot, x]
+
     def find(self, key):
         """
         Search for a key in the hash table.
-        
+
         Args:
             key: Key to search for
-        
+
         Returns:
             Value associated with key or boolean indicating presence
         """
-        # Get initial slot and handle search based on collision strategy
-        idx = self.get_slot(key)
-        orig_idx  = idx
-        
+        # Instances shadow this with the right specialisation in __init__;
+        # this dispatcher only serves unbound/class-level calls
+        return self._find_map(key) if self._is_map else self._find_set(key)
+
+    def _find_set(self, key):
+        """
+        Lookup specialised for set-style tables, where slots hold bare keys.
+
+        Args:
+            key: Key to search for
+
+        Returns:
+            bool: Whether the key is present
+        """
+        key = sys.intern(key)
+        table = self.table
         if self.collision_type == "Chain":
-            for item in self.table[idx]:
-                if (isinstance(item, tuple) and item[0] == key) or item == key:
-                        return item[1] if isinstance(item, tuple) else True
-            return None if isinstance(self, HashMap) else False 
-        
+            slot = table[self.get_slot(key)]
+            if slot is None:
+                return False
+            if isinstance(slot, list):
+                for item in slot:
+                    if item == key:
+                        return True
+                return False
+            return slot == key
+
         elif self.collision_type == "Linear":
-            while self.table[idx]:                        
-                item = self.table[idx]
-                if (isinstance(item, tuple) and item[0] == key) or item == key:
-                    return item[1] if isinstance(item, tuple) else True
-                idx = (idx + 1) % self.table_size                 
-                if orig_idx == idx: 
+            idx = self.get_slot(key)
+            m = self.table_size
+            fps = self._fps
+            fp = hash(key) & 0xFF
+            if self._pow2_shift:
+                # Mirror the triangular probe sequence used by insert
+                start = idx
+                mask = m - 1
+                i = 1
+                while table[idx] is not None:
+                    if fps[idx] == fp and table[idx] == key:
+                        return True
+                    idx = (start + (i * (i + 1)) // 2) & mask
+                    i += 1
+                    if i > m:
+                        break
+            else:
+                orig_idx = idx
+                while table[idx] is not None:
+                    if fps[idx] == fp and table[idx] == key:
+                        return True
+                    idx = (idx + 1) % m
+                    if orig_idx == idx:
+                        break
+            return False
+
+        else:  # Double Hashing
+            idx, step = self._hashes(key)
+            orig_idx = idx
+            m = self.table_size
+            fps = self._fps
+            fp = hash(key) & 0xFF
+            while table[idx] is not None:
+                if fps[idx] == fp and table[idx] == key:
+                    return True
+                idx = (idx + step) % m
+                if orig_idx == idx:
                     break
-            return None if isinstance(self, HashMap) else False
-        
+            return False
+
+    def _find_map(self, key):
+        """
+        Lookup specialised for map-style tables, where slots hold
+        (key, value) tuples.
+
+        Args:
+            key: Key to search for
+
+        Returns:
+            Value associated with key, or None if absent
+        """
+        key = sys.intern(key)
+        if self.collision_type == "Chain":
+            idx = self.get_slot(key)
+            k = self.keys[idx]
+            if k is None:
+                return None
+            if isinstance(k, list):
+                for i, stored in enumerate(k):
+                    if stored == key:
+                        return self.values[idx][i]
+                return None
+            return self.values[idx] if k == key else None
+
+        table = self.table
+        if self.collision_type == "Linear":
+            idx = self.get_slot(key)
+            m = self.table_size
+            fps = self._fps
+            fp = hash(key) & 0xFF
+            if self._pow2_shift:
+                # Mirror the triangular probe sequence used by insert
+                start = idx
+                mask = m - 1
+                i = 1
+                while table[idx] is not None:
+                    if fps[idx] == fp:
+                        item = table[idx]
+                        if item[0] == key:
+                            return item[1]
+                    idx = (start + (i * (i + 1)) // 2) & mask
+                    i += 1
+                    if i > m:
+                        break
+            else:
+                orig_idx = idx
+                while table[idx] is not None:
+                    if fps[idx] == fp:
+                        item = table[idx]
+                        if item[0] == key:
+                            return item[1]
+                    idx = (idx + 1) % m
+                    if orig_idx == idx:
+                        break
+            return None
+
         else:  # Double Hashing
-            # Calculate secondary hash for probe sequence
-            step = 0
-            for i in range(len(key)-1, -1, -1):
-                char = key[i]
-                if char.islower():  value = ord(char) - ord('a')
-                else:   value = ord(char) - ord('A') + 26
-                step = (step * self.z2 + value)
-            step = self.c2 - (step%self.c2)
-            
-            while self.table[idx]:
-                item = self.table[idx]
-                if (isinstance(item, tuple) and item[0] == key) or item == key:
-                    return item[1] if isinstance(item, tuple) else True
-                idx = (idx + step) % self.table_size                
-                if orig_idx == idx: break
-            return None if isinstance(self, HashMap) else False
-            
+            idx, step = self._hashes(key)
+            orig_idx = idx
+            m = self.table_size
+            fps = self._fps
+            fp = hash(key) & 0xFF
+            while table[idx] is not None:
+                if fps[idx] == fp:
+                    item = table[idx]
+                    if item[0] == key:
+                        return item[1]
+                idx = (idx + step) % m
+                if orig_idx == idx:
+                    break
+            return None
+
+
     def get_slot(self, key):
         """
         Calculate the hash slot for a given key using polynomial accumulation.
-        
+
         Args:
             key: Key to hash
-        
+
         Returns:
             int: Calculated slot index
         """
+        # Instances normally run the compiled closure bound by
+        # _compile_get_slot; this method is the uncompiled reference and
+        # delegates to the module-level kernels
+        if self._pow2_shift:
+            return _fib_slot(key, self.z, self._pow2_shift)
+        return _poly_hash(key, self.z, self.table_size)
+
+    def _hashes(self, key):
+        """
+        Compute the primary slot and Double-hashing probe step in one pass.
+
+        Args:
+            key: Key to hash
+
+        Returns:
+            tuple: (slot index, probe step)
+        """
+        # Fuses get_slot and the secondary hash so each Double-hashing
+        # operation walks the key only once. Reducing step mod c2 per
+        # iteration keeps it small without changing the final value.
+        digits = key.encode('ascii').translate(_CHAR_VAL)
         poly = 0
-        for i in range(len(key)-1, -1, -1):
-            char = key[i]
-            if char.islower():  value = ord(char) - ord('a')
-            else:   value = ord(char) - ord('A') + 26
-            poly = (poly *self.z + value) % self.table_size
-        return poly % self.table_size
-    
+        step = 0
+        z = self.z
+        z2 = self.z2
+        c2 = self.c2
+        shift = self._pow2_shift
+        if shift:
+            for v in reversed(digits):
+                poly = (poly * z + v) & _MASK64
+                step = (step * z2 + v) % c2
+            # Forcing the step odd keeps the probe sequence a full cycle
+            # on a power-of-two table
+            return ((poly * _FIB_MULT) & _MASK64) >> shift, (c2 - step) | 1
+        m = self.table_size
+        for v in reversed(digits):
+            poly = (poly * z + v) % m
+            step = (step * z2 + v) % c2
+        return poly, c2 - step
+
     def get_load(self):
         """
         Calculate the current load factor of the hash table.
@@ -162,36 +490,89 @@ class HashTable:
             str: Formatted string showing table contents
         """
         result = ""
+        if self.collision_type == "Chain" and self._is_map:
+            for idx, k in enumerate(self.keys):
+                if k is None:
+                    result += "<EMPTY> | "
+                elif isinstance(k, list):
+                    result += ' ; '.join(
+                        str(pair) for pair in zip(k, self.values[idx])) + " | "
+                else:
+                    result += str((k, self.values[idx])) + " | "
+            return result.rstrip(" | ")
         for slot in self.table:
             if slot:
-                if self.collision_type == "Chain":
+                if self.collision_type == "Chain" and isinstance(slot, list):
                     result += ' ; '.join(str(x) for x in slot) + " | "
                 else:
                     result += str(slot) + " | "
             else:
                 result += "<EMPTY> | "
-        return result.rstrip(" | ")  
+        return result.rstrip(" | ")
     
+    def _reinsert_raw(self, x):
+        """
+        Place an element into the table without the duplicate check done by
+        insert. Only safe during rehash, where every migrated element is
+        already unique. Does not touch total_elements.
+
+        Args:
+            x: Element to place (key or key-value pair)
+        """
+        key = x[0] if self._is_map else x
+        if self.collision_type == "Chain":
+            self._chain_insert(self.get_slot(key), x)
+        elif self.collision_type == "Linear":
+            idx = self.get_slot(key)
+            table = self.table
+            m = self.table_size
+            if self._pow2_shift:
+                start = idx
+                mask = m - 1
+                i = 1
+                while table[idx] is not None:
+                    idx = (start + (i * (i + 1)) // 2) & mask
+                    i += 1
+            else:
+                while table[idx] is not None:
+                    idx = (idx + 1) % m
+            table[idx] = x
+            self._fps[idx] = hash(key) & 0xFF
+        else:  # Double Hashing
+            idx, step = self._hashes(key)
+            table = self.table
+            m = self.table_size
+            while table[idx] is not None:
+                idx = (idx + step) % m
+            table[idx] = x
+            self._fps[idx] = hash(key) & 0xFF
+
     def rehash(self):
         """
         Resize the hash table to a new prime size and reinsert existing elements.
         Useful for maintaining performance as load factor increases.
         """
         new_size = get_next_size()
-        old_table = self.table
-        self.table_size = new_size
-        self.total_elements = 0
-        
-        if self.collision_type == "Chain":
-            self.table = [[] for i in range(self.table_size)]
-            for slot in old_table:
-                for item in slot:
-                    self.insert(item)
+
+        # Migrate via _reinsert_raw: the old table holds only uniques, so
+        # the find() duplicate check in insert would be wasted work.
+        # total_elements is unchanged by migration.
+        if self.collision_type == "Chain" and self._is_map:
+            old_keys, old_values = self.keys, self.values
+            self._alloc_table(new_size)
+            for pair in _chain_map_items(old_keys, old_values):
+                self._reinsert_raw(pair)
         else:
-            self.table = [None] * self.table_size
-            for item in old_table:
-                if item is not None:
-                    self.insert(item)
+            old_table = self.table
+            self._alloc_table(new_size)
+            for slot in old_table:
+                if slot is None:
+                    continue
+                if self.collision_type == "Chain" and isinstance(slot, list):
+                    for item in slot:
+                        self._reinsert_raw(item)
+                else:
+                    self._reinsert_raw(slot)
 
 class HashSet(HashTable):
     """
@@ -1,3 +1,5 @@
+from bisect import bisect_left
+
 import hash_table as ht
 
 class DigitalLibrary:
@@ -55,83 +57,83 @@ class MuskLibrary(DigitalLibrary):
         """
         super().__init__()
         self.unsorted_books = book_titles.copy()
-        self.texts = [None]*len(book_titles)      
+        self.texts = [None]*len(book_titles)
         self.distincts = [None]*len(book_titles)
-        
-        # Sort book titles
-        self.book_titles = self.mergesort_words(book_titles)
-        
+
+        # Sort book titles; set + sorted run in C and dedup in one step
+        self.book_titles = sorted(set(book_titles))
+
         # Process each book
         for i in range(len(book_titles)):
-            text = texts[i]                
+            text = texts[i]
             orig_title = self.unsorted_books[i]
-            
-            # Binary search to find correct index
-            s, e = 0, len(self.book_titles) - 1
-            while s <= e:
-                mid = (s+e)//2
-                if self.book_titles[mid] == orig_title:   
-                    break
-                elif self.book_titles[mid] < orig_title:
-                    s = mid +1
-                else:
-                    e = mid-1
-            
+
+            # Binary search (via bisect) to find correct index
+            mid = bisect_left(self.book_titles, orig_title)
+
             # Store text and distinct words
             self.texts[mid] = text
-            sorted_dist = self.mergesort_words(text)
-            self.distincts[mid] = sorted_dist
+            self.distincts[mid] = sorted(set(text))
 
     def mergesort_words(self, lst):
         """
-        Merge sort implementation that removes duplicate words.
-        
+        Sort a list of words, removing duplicates.
+
         Args:
             lst (list): List of words to sort
-        
+
         Returns:
             list: Sorted list of unique words
         """
-        if len(lst) <= 1:
-            return lst
-        mid = len(lst) //2
-        lst1 = self.mergesort_words(lst[:mid])
-        lst2 = self.mergesort_words(lst[mid:])
-        distinct_words = self.merge(lst1, lst2)
-        return distinct_words
+        # set + sorted run entirely in C and replace the old recursive
+        # mergesort, which paid for Python-level comparisons and a pair of
+        # list slices at every level of the recursion
+        return sorted(set(lst))
 
     def merge(self, left, right):
         """
         Merge two sorted lists, removing duplicates.
-        
+
         Args:
             left (list): First sorted list
             right (list): Second sorted list
-        
+
         Returns:
             list: Merged sorted list with unique elements
         """
         i, j = 0, 0
+        n, m = len(left), len(right)
         merged = []
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]: 
-                if not merged or merged[-1] != left[i]:
-                    merged.append(left[i])
-                    if left[i] == right[j] : j += 1
+        append = merged.append
+        last = None
+        while i < n and j < m:
+            x = left[i]
+            y = right[j]
+            if x <= y:
+                if x != last:
+                    append(x)
+                    last = x
+                if x == y:
+                    j += 1
                 i += 1
             else:
-                if not merged or merged[-1] != right[j]:
-                    merged.append(right[j])
+                if y != last:
+                    append(y)
+                    last = y
                 j += 1
-        
+
         # Handle remaining elements
-        while i < len(left):
-            if not merged or merged[-1] != left[i]:
-                    merged.append(left[i])
+        while i < n:
+            x = left[i]
+            if x != last:
+                append(x)
+                last = x
             i += 1
-        while j < len(right):
-            if not merged or merged[-1] != right[j]:
-                    merged.append(right[j])
+        while j < m:
+            y = right[j]
+            if y != last:
+                append(y)
+                last = y
             j += 1
 
         return merged
@@ -146,16 +148,7 @@ class MuskLibrary(DigitalLibrary):
         Returns:
             list: Sorted list of distinct words in the book
         """
-        s, e = 0, len(self.book_titles) - 1
-        while s <= e:
-            mid = (s+e)//2
-            if self.book_titles[mid] == book_title:   
-                break
-            elif self.book_titles[mid] < book_title:
-                s = mid +1
-            else:
-                e = mid-1
-        return self.distincts[mid]
+        return self.distincts[bisect_left(self.book_titles, book_title)]
     
     def count_distinct_words(self, book_title):
         """
@@ -183,16 +176,9 @@ class MuskLibrary(DigitalLibrary):
         ans = []
         for i in range(len(self.distincts)):
             words = self.distincts[i]
-            s, e = 0, len(words) - 1
-            while s <= e:
-                mid = (s+e)//2
-                if words[mid] == keyword:   
-                    ans.append(self.book_titles[i])
-                    break
-                elif words[mid] < keyword:
-                    s = mid +1
-                else:
-                    e = mid-1
+            pos = bisect_left(words, keyword)
+            if pos < len(words) and words[pos] == keyword:
+                ans.append(self.book_titles[i])
         return ans
     
     def print_books(self):
@@ -238,6 +224,15 @@ class JGBLibrary(DigitalLibrary):
             book_title (str): Title of the book
             text (list): Words in the book
         """
+        # Dedup with the built-in dict first (C speed, keeps first-seen
+        # order) so the hash set sees each word exactly once and its
+        # per-insert duplicate check never fires
+        unique_words = dict.fromkeys(text)
+
         # Create a hash set to store unique words
         hashy = ht.HashSet(self.collision_type, self.params)
+        for word in unique_words:
+            hashy.insert(word)
+
+        self.books.insert((book_title, hashy))
         self.appended_books.append(book_title)
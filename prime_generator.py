@@ -8,21 +8,72 @@ for dynamic hash table resizing operations.
 # primes in descending order
 prime_sizes = [29]
 
+# largest size handed out so far, used to seed refills
+_last_size = 2
+
 def set_primes(list_of_primes):
     """
     Set the global list of prime sizes for hash table resizing.
-    
+
     Args:
         list_of_primes (list): A list of prime numbers in descending order
     """
     global prime_sizes
     prime_sizes = list_of_primes
-    
+
+def _is_prime(n):
+    """
+    Test primality by trial division over 6k +/- 1 candidates.
+
+    Args:
+        n (int): Number to test
+
+    Returns:
+        bool: Whether n is prime
+    """
+    if n < 2:
+        return False
+    if n < 4:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    f = 5
+    while f * f <= n:
+        if n % f == 0 or n % (f + 2) == 0:
+            return False
+        f += 6
+    return True
+
+def _next_prime(n):
+    """
+    Find the smallest prime strictly greater than n.
+
+    Args:
+        n (int): Lower bound
+
+    Returns:
+        int: The next prime after n
+    """
+    candidate = n + 1
+    while not _is_prime(candidate):
+        candidate += 1
+    return candidate
+
 def get_next_size():
     """
     Get the next prime size for hash table resizing.
-    
+
+    When the predefined list runs out, it is extended on demand with the
+    next prime above double the largest size handed out so far, so long
+    ingest runs never hit an empty list.
+
     Returns:
-        int: The next prime size from the predefined list
+        int: The next prime size
     """
-    return prime_sizes.pop()
+    global _last_size
+    if not prime_sizes:
+        prime_sizes.append(_next_prime(2 * _last_size))
+    size = prime_sizes.pop()
+    if size > _last_size:
+        _last_size = size
+    return size